@@ -8,17 +8,44 @@ Uses org.gnome.Mutter.DisplayConfig for monitor management.
 This module provides the command-line interface for DisplayCtl.
 """
 
-import json
+import os
 import sys
-import argparse
-import re
+import time
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, Any, List
 from enum import IntEnum
 
+
+def _lazy_import(name):
+    """Return a proxy that imports the named module on first use."""
+    class _LazyModule:
+        def __getattr__(self, attr):
+            import importlib
+            module = importlib.import_module(name)
+            globals()[name] = module
+            return getattr(module, attr)
+    return _LazyModule()
+
+
+# argparse is only needed to parse the command line; don't pay its import
+# cost until main() actually touches it.
+argparse = _lazy_import('argparse')
+
+# Prefer orjson for (de)serializing configs when available; fall back to
+# the stdlib json module otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Defer dbus import until needed
 dbus = None
 
+# Resolved once per process; Path.home() stats $HOME and the mkdir is a
+# syscall pair we don't need to repeat per manager instance.
+_CONFIG_DIR = None
+
 
 class ApplyMethod(IntEnum):
     """Methods for applying monitor configurations via D-Bus."""
@@ -27,6 +54,25 @@ class ApplyMethod(IntEnum):
     PERSISTENT = 2  # Apply configuration permanently
 
 
+def _dbus_to_py(obj):
+    """Recursively convert a D-Bus value into plain Python primitives.
+
+    One type dispatch shared by every properties conversion; the result
+    contains only JSON-ready dicts, lists, str, int, and float.
+    """
+    if isinstance(obj, str):
+        return str(obj)
+    if isinstance(obj, bool):
+        return obj
+    if isinstance(obj, (int, float)):
+        return obj.real
+    if isinstance(obj, dict):
+        return {_dbus_to_py(k): _dbus_to_py(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_dbus_to_py(v) for v in obj]
+    return obj
+
+
 def _ensure_dbus():
     """Import dbus module when needed."""
     global dbus
@@ -44,14 +90,24 @@ def _ensure_dbus():
 class MonitorConfigManager:
     """Manages monitor configurations using GNOME's D-Bus interface."""
 
+    # How long a fetched state stays fresh. Monitor topology cannot
+    # change mid-operation within such a short window, so repeated
+    # calls in one invocation reuse the parsed result.
+    _STATE_CACHE_TTL = 1.0
+
     def __init__(self):
         self.bus = None
         self.display_config = None
         self.interface = None
+        self._state_cache = None
+        self._state_cache_time = 0.0
 
-        # Create config directory
-        self.config_dir = Path.home() / '.config' / 'displayctl'
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        # Resolve the config directory (memoized across instances); it
+        # is only created by save_config, the one path that writes to it
+        global _CONFIG_DIR
+        if _CONFIG_DIR is None:
+            _CONFIG_DIR = Path.home() / '.config' / 'displayctl'
+        self.config_dir = _CONFIG_DIR
 
     def _ensure_dbus_connection(self):
         """Ensure D-Bus connection is established."""
@@ -68,31 +124,67 @@ class MonitorConfigManager:
             )
 
     def _safe_dict_conversion(self, properties):
-        """Safely convert D-Bus properties to a dictionary."""
-        try:
-            if isinstance(properties, dict):
-                return dict(properties)
-            else:
-                # Handle D-Bus arrays/structs
-                return dict(properties) if properties else {}
-        except (ValueError, TypeError):
-            return {}
+        """Convert D-Bus properties to a plain dictionary."""
+        # Single conversion pass shared with the top-level properties;
+        # this runs per mode, so no try/except frame on the hot path.
+        return _dbus_to_py(properties) if properties else {}
 
     def get_current_state(self) -> Dict[str, Any]:
         """Get the current monitor configuration state."""
+        now = time.monotonic()
+        if (self._state_cache is not None
+                and now - self._state_cache_time < self._STATE_CACHE_TTL):
+            return self._state_cache
+
         self._ensure_dbus_connection()
         try:
             # Get current resources (monitors, logical monitors, etc.)
             result = self.interface.GetCurrentState()
             serial, monitors, logical_monitors, properties = result
 
+            # An unchanged serial means the topology hasn't moved since
+            # the last fetch; the parsed state is still valid even past
+            # the TTL, so skip the re-parse.
+            if (self._state_cache is not None
+                    and int(serial) == self._state_cache['serial']):
+                self._state_cache_time = now
+                return self._state_cache
+
             monitors_ = self._parse_monitors(monitors)
-            return {
+            self._state_cache = {
                 'serial': int(serial),
                 'monitors': monitors_,
                 'logical_monitors': self._parse_logical_monitors(
                     logical_monitors, monitors_),
-                'properties': dict(properties)
+                'properties': self._safe_dict_conversion(properties)
+            }
+            self._state_cache_time = now
+            return self._state_cache
+        except Exception as e:
+            if 'dbus' in str(type(e).__module__):
+                raise RuntimeError(f"Failed to get current state: {e}")
+            else:
+                raise
+
+    def get_current_state_minimal(self) -> Dict[str, Any]:
+        """Get only the serial and physical monitors of the current state.
+
+        Validation in _apply_config needs just these two pieces, so the
+        logical-monitor re-parse is skipped. A fresh fully-parsed state
+        from get_current_state is reused when available.
+        """
+        now = time.monotonic()
+        if (self._state_cache is not None
+                and now - self._state_cache_time < self._STATE_CACHE_TTL):
+            return self._state_cache
+
+        self._ensure_dbus_connection()
+        try:
+            result = self.interface.GetCurrentState()
+            serial, monitors, _logical_monitors, _properties = result
+            return {
+                'serial': int(serial),
+                'monitors': self._parse_monitors(monitors),
             }
         except Exception as e:
             if 'dbus' in str(type(e).__module__):
@@ -104,31 +196,44 @@ class MonitorConfigManager:
         """Parse monitor information from D-Bus response."""
         parsed_monitors = []
 
+        # Bind hot names to locals; saves an attribute/global lookup per
+        # mode across (monitors x modes) iterations.
+        _safe = self._safe_dict_conversion
+        _str = str
+        _round = round
+
         for monitor in monitors:
             data1, modes, properties = monitor
             connector, _vendor, _product, _serial = data1
 
             # Extract clean connector name from D-Bus structure
-            connector_name = str(connector)
+            connector_name = _str(connector)
 
             parsed_monitor = {
                 'connector': connector_name,
                 'modes': [],
-                'properties': self._safe_dict_conversion(properties)
+                'properties': _safe(properties)
             }
 
             for mode in modes:
                 (mode_id, width, height, refresh_rate, preferred_scale,
                  supported_scales, mode_properties) = mode
 
+                # dbus.Int32/dbus.Double subclass int/float, so .real
+                # yields a plain scalar without the int()/float() call
+                # dispatch. Refresh rates are effectively mHz-quantized
+                # and scales step in quarters, so both are stored as
+                # small ints (schema format 2) — fewer bytes on disk and
+                # cheaper JSON number parsing.
                 parsed_mode = {
-                    'id': str(mode_id),
-                    'width': int(width),
-                    'height': int(height),
-                    'refresh_rate': float(refresh_rate),
-                    'preferred_scale': float(preferred_scale),
-                    'supported_scales': [float(s) for s in supported_scales],
-                    'properties': self._safe_dict_conversion(mode_properties)
+                    'id': _str(mode_id),
+                    'width': width.real,
+                    'height': height.real,
+                    'refresh_mhz': _round(refresh_rate * 1000),
+                    'preferred_scale_q4': _round(preferred_scale * 4),
+                    'supported_scales_q4': [
+                        _round(s * 4) for s in supported_scales],
+                    'properties': _safe(mode_properties)
                 }
                 parsed_monitor['modes'].append(parsed_mode)
 
@@ -149,6 +254,17 @@ class MonitorConfigManager:
         """Parse logical monitor information from D-Bus response."""
         parsed_logical = []
 
+        # Index the current mode per connector once instead of re-scanning
+        # every monitor's mode list for each monitor spec.
+        current_mode_by_connector = {
+            m['connector']: next(
+                (mm['id'] for mm in m['modes']
+                 if mm['properties'].get('is-current', False)),
+                None)
+            for m in monitors
+        }
+        _safe = self._safe_dict_conversion
+
         for logical_monitor in logical_monitors:
             (x, y, scale, transform, primary, monitor_specs,
              properties) = logical_monitor
@@ -160,7 +276,7 @@ class MonitorConfigManager:
                 'transform': int(transform),
                 'primary': bool(primary),
                 'monitors': [],
-                'properties': self._safe_dict_conversion(properties)
+                'properties': _safe(properties)
             }
 
             for monitor_spec in monitor_specs:
@@ -169,8 +285,7 @@ class MonitorConfigManager:
 
                     parsed_logical_monitor['monitors'].append({
                         'connector': connector,
-                        'mode_id': self.get_mode_for_connector(connector,
-                                                               monitors),
+                        'mode_id': current_mode_by_connector.get(connector),
                     })
                 except (IndexError, ValueError, TypeError) as e:
                     print(f"Warning: Failed to parse monitor spec: {e}")
@@ -181,11 +296,41 @@ class MonitorConfigManager:
     def save_config(self, name: str) -> None:
         """Save the current monitor configuration."""
         try:
-            config = self.get_current_state()
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            # 'format' versions the on-disk schema (2 = quantized
+            # refresh/scale fields); older configs without it still load
+            config = {'format': 2, **self.get_current_state()}
             config_file = self.config_dir / f"{name}.json"
 
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+            else:
+                import json
+                data = json.dumps(config, indent=2).encode()
+
+            # Write the serialized bytes through a raw fd in one shot (no
+            # buffered-IO layer), to a temp file renamed into place so an
+            # interrupted save never leaves a torn config behind.
+            tmp_file = config_file.with_suffix('.json.tmp')
+            try:
+                fd = os.open(str(tmp_file),
+                             os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, data)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_file, config_file)
+            except OSError:
+                tmp_file.unlink(missing_ok=True)
+                raise
+
+            # Seed the list_configs summary cache so the next listing
+            # doesn't have to re-parse the file we just wrote.
+            st = os.stat(config_file)
+            cache = self._load_list_cache()
+            cache[str(config_file)] = ((st.st_mtime_ns, st.st_size),
+                                       self._summarize_config(config))
+            self._save_list_cache(cache)
 
             print(f"Configuration saved as '{name}' to {config_file}")
 
@@ -209,8 +354,13 @@ class MonitorConfigManager:
             sys.exit(1)
 
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            # Whole-file read; skips the buffered-IO layer entirely
+            data = config_file.read_bytes()
+            if orjson is not None:
+                config = orjson.loads(data)
+            else:
+                import json
+                config = json.loads(data)
 
             if dry_run:
                 self._show_config_preview(config, name)
@@ -224,18 +374,20 @@ class MonitorConfigManager:
 
     def _show_config_preview(self, config: Dict[str, Any], name: str) -> None:
         """Show what a configuration would do without applying it."""
-        print(f"Configuration '{name}' would apply:")
-        print(f"Serial: {config['serial']}")
+        lines = [f"Configuration '{name}' would apply:",
+                 f"Serial: {config['serial']}"]
 
         for i, lm in enumerate(config.get('logical_monitors', [])):
             primary = " (primary)" if lm.get('primary', False) else ""
-            print(f"  Logical monitor {i+1}: {lm['x']},{lm['y']} "
-                  f"scale {lm['scale']}{primary}")
+            lines.append(f"  Logical monitor {i+1}: {lm['x']},{lm['y']} "
+                         f"scale {lm['scale']}{primary}")
             for monitor in lm.get('monitors', []):
-                print(f"    - {monitor['connector']} "
-                      f"(mode: {monitor['mode_id']})")
+                lines.append(f"    - {monitor['connector']} "
+                             f"(mode: {monitor['mode_id']})")
 
-        print("\nUse 'load' without --dry-run to apply this configuration.")
+        lines.append("\nUse 'load' without --dry-run to apply this "
+                     "configuration.")
+        sys.stdout.write('\n'.join(lines) + '\n')
 
     def _apply_config(self, config: Dict[str, Any],
                       method: ApplyMethod = ApplyMethod.TEMPORARY) -> None:
@@ -249,28 +401,49 @@ class MonitorConfigManager:
 
         try:
             # Get current state to validate monitors are still available
-            current_state = self.get_current_state()
+            current_state = self.get_current_state_minimal()
             current_monitors = {
                 m['connector']: m for m in current_state['monitors']
             }
 
-            # Validate that all monitors in the config are still available
-            config_monitors = set()
-            for lm in config.get('logical_monitors', []):
-                for monitor in lm.get('monitors', []):
-                    config_monitors.add(monitor['connector'])
+            logical_monitors = config.get('logical_monitors', [])
 
-            missing_monitors = config_monitors - set(current_monitors.keys())
+            # Validate that all monitors in the config are still available
+            # (dict_keys is a set-like view, no copy needed)
+            config_monitors = {
+                monitor['connector']
+                for lm in logical_monitors
+                for monitor in lm.get('monitors', [])
+            }
+            missing_monitors = config_monitors - current_monitors.keys()
             if missing_monitors:
                 missing = ', '.join(missing_monitors)
                 print(f"Warning: Monitors not currently available: {missing}")
                 print("Configuration cannot be applied.")
                 return
 
+            # Index saved and available modes by connector once, so the
+            # fallback lookups below are dict probes instead of nested scans.
+            saved_modes_by_connector = {
+                m['connector']: {mm['id']: mm for mm in m.get('modes', [])}
+                for m in config.get('monitors', [])
+            }
+            available_modes_by_connector = {
+                c: {m['id']: m for m in mon['modes']}
+                for c, mon in current_monitors.items()
+            }
+            # reversed() so the first mode listed per resolution wins,
+            # matching the old linear search
+            modes_by_resolution = {
+                c: {(m['width'], m['height']): m['id']
+                    for m in reversed(mon['modes'])}
+                for c, mon in current_monitors.items()
+            }
+
             # Convert saved config to D-Bus format
             logical_monitors_dbus = []
 
-            for lm in config.get('logical_monitors', []):
+            for lm in logical_monitors:
                 # Build monitor specs for this logical monitor
                 monitor_specs = []
 
@@ -282,43 +455,29 @@ class MonitorConfigManager:
                     # Validate the mode still exists
                     current_monitor = current_monitors.get(connector)
                     if current_monitor:
-                        available_modes = {
-                            m['id']: m for m in current_monitor['modes']
-                        }
+                        available_modes = available_modes_by_connector[
+                            connector]
                         if mode_id not in available_modes:
                             warning_msg = (
                                 f"Warning: Mode {mode_id} no longer "
                                 f"available for {connector}")
                             print(warning_msg)
-                            # Try to find a similar mode
-                            saved_mode = None
-                            for saved_lm in config.get('logical_monitors', []):
-                                for saved_mon in saved_lm.get('monitors', []):
-                                    if saved_mon['connector'] == connector:
-                                        # Look for the mode in original config
-                                        for config_monitor in config.get(
-                                                'monitors', []):
-                                            if (config_monitor['connector'] ==
-                                                    connector):
-                                                for mode in config_monitor[
-                                                        'modes']:
-                                                    if mode['id'] == mode_id:
-                                                        saved_mode = mode
-                                                        break
+                            # Look up the mode in the original config
+                            saved_mode = saved_modes_by_connector.get(
+                                connector, {}).get(mode_id)
 
                             if saved_mode:
                                 # Try to find a mode with matching resolution
-                                for mode in current_monitor['modes']:
-                                    if (mode['width'] == saved_mode['width']
-                                            and mode['height'] ==
-                                            saved_mode['height']):
-                                        alt_msg = (
-                                            f"Using alternative mode "
-                                            f"{mode['id']} for "
-                                            f"{connector}")
-                                        print(alt_msg)
-                                        mode_id = mode['id']
-                                        break
+                                alt_mode_id = modes_by_resolution[
+                                    connector].get((saved_mode['width'],
+                                                    saved_mode['height']))
+                                if alt_mode_id is not None:
+                                    alt_msg = (
+                                        f"Using alternative mode "
+                                        f"{alt_mode_id} for "
+                                        f"{connector}")
+                                    print(alt_msg)
+                                    mode_id = alt_mode_id
                                 else:
                                     no_alt_msg = (
                                         f"No suitable alternative "
@@ -380,73 +539,162 @@ class MonitorConfigManager:
                 print(f"Error applying configuration: {e}")
             raise
 
+    def _summarize_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the compact summary that list_configs prints."""
+        logical_monitors = config.get('logical_monitors', [])
+        return {
+            'monitor_count': sum(
+                len(lm.get('monitors', [])) for lm in logical_monitors),
+            'logical_monitors': [
+                {
+                    'x': lm['x'],
+                    'y': lm['y'],
+                    'scale': lm['scale'],
+                    'primary': lm.get('primary', False),
+                    'monitors': [
+                        {
+                            'connector': monitor['connector'],
+                            'mode_id': monitor['mode_id'],
+                        }
+                        for monitor in lm.get('monitors', [])
+                    ],
+                }
+                for lm in logical_monitors
+            ],
+        }
+
+    def _load_list_cache(self) -> Dict[str, Any]:
+        """Load the pickled summary cache used by list_configs."""
+        import pickle
+        cache_path = self.config_dir / '.list_cache.pkl'
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return {}
+
+    def _save_list_cache(self, cache: Dict[str, Any]) -> None:
+        """Write the pickled summary cache back to disk."""
+        import pickle
+        cache_path = self.config_dir / '.list_cache.pkl'
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(cache, f, pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            # The cache is purely an optimization; ignore write failures.
+            pass
+
     def list_configs(self) -> None:
         """List all saved configurations."""
-        config_files = list(self.config_dir.glob("*.json"))
+        # os.scandir returns dir entries with a cached stat result, so the
+        # whole directory is enumerated, stat'ed, and sorted in one pass.
+        try:
+            with os.scandir(self.config_dir) as it:
+                config_files = sorted(
+                    (entry for entry in it
+                     if entry.name.endswith('.json')
+                     and entry.is_file(follow_symlinks=False)),
+                    key=attrgetter('name'))
+        except FileNotFoundError:
+            config_files = []
 
         if not config_files:
             print(f"No configurations found in {self.config_dir}")
             return
 
-        print("Saved configurations:")
-        for config_file in sorted(config_files):
-            name = config_file.stem
-            try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-
-                logical_monitors = config.get('logical_monitors', [])
-                monitor_count = sum(
-                    len(lm.get('monitors', [])) for lm in logical_monitors)
+        # Summaries are cached in a pickle sidecar keyed on (mtime, size)
+        # so unchanged configs are not re-parsed on every invocation.
+        cache = self._load_list_cache()
+        cache_dirty = False
+        seen = set()
 
-                print(f"  {name}: {monitor_count} monitor(s)")
-
-                for i, lm in enumerate(logical_monitors):
-                    primary = " (primary)" if lm.get('primary', False) else ""
-                    print(f"    Logical monitor {i+1}: {lm['x']}x{lm['y']}, "
-                          f"scale {lm['scale']}{primary}")
-                    for monitor in lm.get('monitors', []):
-                        print(f"      - {monitor['connector']} "
-                              f"(mode: {monitor['mode_id']})")
-
-            except Exception as e:
-                print(f"  {name}: (error reading file: {e})")
+        lines = ["Saved configurations:"]
+        for config_file in config_files:
+            name = config_file.name[:-5]
+            try:
+                st = config_file.stat()
+                stat_key = (st.st_mtime_ns, st.st_size)
+                seen.add(config_file.path)
+                entry = cache.get(config_file.path)
+                if entry is not None and entry[0] == stat_key:
+                    summary = entry[1]
+                else:
+                    # buffering=0: one readall, no intermediate buffer
+                    with open(config_file.path, 'rb', buffering=0) as f:
+                        data = f.read()
+                    if orjson is not None:
+                        config = orjson.loads(data)
+                    else:
+                        import json
+                        config = json.loads(data)
+                    summary = self._summarize_config(config)
+                    cache[config_file.path] = (stat_key, summary)
+                    cache_dirty = True
+
+                lines.append(
+                    f"  {name}: {summary['monitor_count']} monitor(s)")
+
+                for i, lm in enumerate(summary['logical_monitors']):
+                    primary = " (primary)" if lm['primary'] else ""
+                    lines.append(
+                        f"    Logical monitor {i+1}: {lm['x']}x{lm['y']}, "
+                        f"scale {lm['scale']}{primary}")
+                    for monitor in lm['monitors']:
+                        lines.append(f"      - {monitor['connector']} "
+                                     f"(mode: {monitor['mode_id']})")
+
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                lines.append(f"  {name}: (error reading file: {e})")
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+        # Drop entries for deleted configs and persist only when changed.
+        if cache.keys() - seen:
+            cache = {k: v for k, v in cache.items() if k in seen}
+            cache_dirty = True
+        if cache_dirty:
+            self._save_list_cache(cache)
 
     def show_current(self) -> None:
         """Show current monitor configuration."""
         try:
             config = self.get_current_state()
 
-            print("Current monitor configuration:")
-            print(f"Serial: {config['serial']}")
-
-            print("\nAvailable monitors:")
+            # Accumulate the report and emit it with one write; a big
+            # monitor dump otherwise costs one syscall per print().
+            lines = ["Current monitor configuration:",
+                     f"Serial: {config['serial']}",
+                     "",
+                     "Available monitors:"]
             for monitor in config['monitors']:
-                print(f"  {monitor['connector']}:")
-                print(f"    Available modes: {len(monitor['modes'])}")
+                lines.append(f"  {monitor['connector']}:")
+                lines.append(f"    Available modes: {len(monitor['modes'])}")
                 for mode in monitor['modes'][:3]:  # Show first 3 modes
-                    refresh = mode['refresh_rate']
-                    print(f"      {mode['width']}x{mode['height']}"
-                          f"@{refresh:.1f}Hz")
+                    refresh = mode['refresh_mhz'] / 1000.0
+                    lines.append(f"      {mode['width']}x{mode['height']}"
+                                 f"@{refresh:.1f}Hz")
                 if len(monitor['modes']) > 3:
                     remaining = len(monitor['modes']) - 3
-                    print(f"      ... and {remaining} more")
+                    lines.append(f"      ... and {remaining} more")
 
-            print("\nActive logical monitors:")
+            lines.append("")
+            lines.append("Active logical monitors:")
             for i, lm in enumerate(config['logical_monitors']):
                 primary = " (primary)" if lm['primary'] else ""
-                print(f"  Logical monitor {i+1}: {lm['x']},{lm['y']} "
-                      f"scale {lm['scale']}{primary}")
+                lines.append(f"  Logical monitor {i+1}: {lm['x']},{lm['y']} "
+                             f"scale {lm['scale']}{primary}")
                 for monitor in lm['monitors']:
-                    print(f"    - {monitor['connector']} "
-                          f"(mode: {monitor['mode_id']})")
+                    lines.append(f"    - {monitor['connector']} "
+                                 f"(mode: {monitor['mode_id']})")
+
+            sys.stdout.write('\n'.join(lines) + '\n')
 
         except Exception as e:
             print(f"Error getting current configuration: {e}")
-            # Add debug information
-            import traceback
-            print("Debug information:")
-            traceback.print_exc()
+            if os.environ.get('DISPLAYCTL_DEBUG'):
+                import traceback
+                print("Debug information:")
+                traceback.print_exc()
             sys.exit(1)
 
     def delete_config(self, name: str) -> None:
@@ -459,14 +707,65 @@ class MonitorConfigManager:
 
         try:
             config_file.unlink()
+            cache = self._load_list_cache()
+            if cache.pop(str(config_file), None) is not None:
+                self._save_list_cache(cache)
             print(f"Configuration '{name}' deleted")
         except Exception as e:
             print(f"Error deleting configuration: {e}")
             sys.exit(1)
 
 
+_SIMPLE_COMMANDS = {'save', 'load', 'list', 'current', 'delete'}
+
+
+def _dispatch_fast(argv):
+    """Dispatch plain invocations without constructing argparse.
+
+    Handles the common flag-free command shapes ('list', 'current',
+    'save NAME', 'load NAME', 'delete NAME') directly; returns False for
+    anything else so the full parser can take over.
+    """
+    if not argv or argv[0] not in _SIMPLE_COMMANDS:
+        return False
+
+    command, args = argv[0], argv[1:]
+    if any(arg.startswith('-') for arg in args):
+        return False
+    if command in ('list', 'current'):
+        if args:
+            return False
+    elif len(args) != 1:
+        return False
+
+    manager = MonitorConfigManager()
+    if command == 'save':
+        manager.save_config(args[0])
+    elif command == 'load':
+        manager.load_config(args[0])
+    elif command == 'list':
+        manager.list_configs()
+    elif command == 'current':
+        manager.show_current()
+    elif command == 'delete':
+        manager.delete_config(args[0])
+    return True
+
+
 def main():
     """Main entry point."""
+    # Fast path: flag-free invocations skip argparse construction (and
+    # its import) entirely.
+    try:
+        if _dispatch_fast(sys.argv[1:]):
+            return
+    except KeyboardInterrupt:
+        print("\nOperation cancelled")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
     parser = argparse.ArgumentParser(
         description="DisplayCtl - Display Configuration Manager for GNOME",
         formatter_class=argparse.RawDescriptionHelpFormatter,